@@ -12,28 +12,92 @@ License: MIT
 
 import os
 import json
+import time
+import asyncio
 import logging
-from typing import Any, Dict, List, Optional, Union
+import functools
+import itertools
+import contextlib
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+import anyio
 from fastmcp import FastMCP
-from python_abraflexi import ReadOnly, ReadWrite
+from python_abraflexi import AbraFlexiException, NotFoundException, ReadOnly, ReadWrite
+from requests import Session
+from requests.adapters import HTTPAdapter
 from dotenv import load_dotenv
 
+try:
+    import orjson
+except ImportError:  # optional speedup, fall back to stdlib json
+    orjson = None
+
 # Load environment variables from .env file
 load_dotenv()
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO if os.getenv("DEBUG") else logging.WARNING,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
 logger = logging.getLogger(__name__)
 
 # Initialize FastMCP
 mcp = FastMCP("AbraFlexi MCP Server")
 
+
+def _envbool(name: str, default: str = "false") -> bool:
+    """Parse a boolean environment variable ('true', '1' or 'yes')."""
+    return os.getenv(name, default).lower() in ("true", "1", "yes")
+
+
+def _as_int(value: Any, default: Optional[int] = None) -> Optional[int]:
+    """Normalize a numeric parameter to int, keeping None as the default."""
+    return default if value is None else int(value)
+
+
+# Read-only mode and output format are fixed for the lifetime of the server process
+_READ_ONLY = _envbool("READ_ONLY", "true")
+_PRETTY_JSON = _envbool("ABRAFLEXI_MCP_PRETTY_JSON")
+
+# JSON encoders are configured once and shared by all tool calls
+_json_compact = json.JSONEncoder(ensure_ascii=False, default=str, separators=(",", ":")).encode
+_json_pretty = json.JSONEncoder(ensure_ascii=False, default=str, indent=2).encode
+if orjson is not None:
+    # Datetimes go through default=str, as with the stdlib encoder
+    _orjson_compact = functools.partial(
+        orjson.dumps,
+        option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME,
+        default=str
+    )
+    _orjson_pretty = functools.partial(
+        orjson.dumps,
+        option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME,
+        default=str
+    )
+
 # Global configuration
 abraflexi_config: Optional[Dict[str, Any]] = None
 
+# Client options per evidence in EVIDENCES, built from the configuration once
+_client_options: Dict[str, Dict[str, Any]] = {}
+
+# Bulk tools split their work into chunks sent concurrently
+BULK_CHUNK_SIZE = 50
+BULK_CONCURRENCY = 10
+
+# All clients share one HTTP session; the pool matches asyncio's default
+# thread pool limit so worker threads do not discard connections
+HTTP_POOL_SIZE = 32
+_http_session: Optional[Session] = None
+
+# Idle AbraFlexi clients keyed by (client class, evidence); only evidences
+# from EVIDENCES are pooled, and at most POOL_IDLE_MAX clients per key
+POOL_IDLE_MAX = BULK_CONCURRENCY
+_idle_clients: Dict[Tuple[type, str], List[ReadOnly]] = {}
+
+# Responses of read tools are cached for a few seconds (0 disables caching)
+CACHE_TTL = int(os.getenv("ABRAFLEXI_MCP_CACHE_TTL", "30"))
+CACHE_SIZE = 256
+_response_cache: Dict[Tuple[Any, ...], Tuple[float, str]] = {}
+# Bumped on every invalidation (None counts clears of the whole cache), so
+# reads that raced with a write do not store their pre-write results
+_cache_generations: Dict[Optional[str], int] = {}
+
 
 def get_abraflexi_config() -> Dict[str, Any]:
     """Get AbraFlexi configuration from environment variables.
@@ -55,7 +119,7 @@ def get_abraflexi_config() -> Dict[str, Any]:
         if not company:
             raise ValueError("ABRAFLEXI_COMPANY environment variable is required")
         
-        logger.info(f"Initializing AbraFlexi configuration for {url}/{company}")
+        logger.info("Initializing AbraFlexi configuration for %s/%s", url, company)
         
         abraflexi_config = {
             "url": url,
@@ -74,37 +138,257 @@ def get_abraflexi_config() -> Dict[str, Any]:
                 "Either ABRAFLEXI_AUTHSESSID or ABRAFLEXI_LOGIN/ABRAFLEXI_PASSWORD must be set"
             )
         
+        _client_options.update(
+            (ev["name"], {**abraflexi_config, "evidence": ev["name"]}) for ev in EVIDENCES
+        )
+        
         logger.info("Successfully configured AbraFlexi connection")
     
     return abraflexi_config
 
 
-def get_readonly_client(evidence: str) -> ReadOnly:
-    """Create a read-only AbraFlexi client for the specified evidence.
+def _new_client(client_class: type, evidence: str) -> ReadOnly:
+    """Create a new AbraFlexi client for the specified evidence.
     
     Args:
+        client_class: ReadOnly or ReadWrite
         evidence: Evidence name (e.g., 'faktura-vydana', 'adresar')
         
     Returns:
         ReadOnly: Configured AbraFlexi client
     """
-    config = get_abraflexi_config()
-    options = {**config, "evidence": evidence}
-    return ReadOnly(None, options)
+    options = _client_options.get(evidence)
+    if options is None:
+        config = get_abraflexi_config()
+        # Options of evidences outside EVIDENCES are built per call, so
+        # arbitrary evidence names cannot grow the prebuilt options
+        options = _client_options.get(evidence) or {**config, "evidence": evidence}
+    return _share_session(client_class(None, options))
+
+
+def _share_session(client: ReadOnly) -> ReadOnly:
+    """Make the client use the HTTP session shared by all clients.
+    
+    The first client's session, already configured with authentication and
+    TLS settings, becomes the shared one and gets a larger connection pool.
+    Connections to AbraFlexi are then kept alive across evidences.
+    
+    Args:
+        client: Newly created AbraFlexi client
+        
+    Returns:
+        ReadOnly: The same client
+    """
+    global _http_session
+    
+    if _http_session is None:
+        adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE)
+        client.session.mount("https://", adapter)
+        client.session.mount("http://", adapter)
+        _http_session = client.session
+    else:
+        client.session.close()
+        client.session = _http_session
+    return client
+
+
+def _reset_client(client: ReadOnly) -> ReadOnly:
+    """Clear per-call state left on a client by a finished tool call.
+    
+    Also drops the last response and result, so idle clients do not keep
+    the previous payload alive.
+    
+    Args:
+        client: Pooled AbraFlexi client
+        
+    Returns:
+        ReadOnly: The same client, ready for the next request
+    """
+    client.filter = None
+    client.default_url_params.clear()
+    client.data = {}
+    client.my_key = None
+    client.last_inserted_id = None
+    client.last_response_code = None
+    client.last_response = None
+    client.last_result = None
+    client.errors = []
+    client.row_count = None
+    if isinstance(client, ReadWrite):
+        client.post_fields = None
+    client._update_api_url()
+    return client
+
+
+@contextlib.contextmanager
+def _checkout_client(client_class: type, evidence: str) -> Iterator[ReadOnly]:
+    """Borrow an idle client from the pool, creating one when none is free.
+    
+    A borrowed client is used by exactly one tool call at a time, so
+    concurrent calls never share request state, while returned clients keep
+    their HTTP session (and the kept-alive connection to AbraFlexi). Clients
+    of cancelled calls are not returned, as their request may still be running,
+    and neither are clients of unknown evidences or above POOL_IDLE_MAX.
+    
+    Args:
+        client_class: ReadOnly or ReadWrite
+        evidence: Evidence name (e.g., 'faktura-vydana', 'adresar')
+        
+    Yields:
+        ReadOnly: Configured AbraFlexi client
+    """
+    pooled = evidence in _EVIDENCE_NAMES
+    idle = _idle_clients.setdefault((client_class, evidence), []) if pooled else []
+    client = idle.pop() if idle else _new_client(client_class, evidence)
+    cancelled = False
+    try:
+        yield client
+    except asyncio.CancelledError:
+        # A worker thread may still be running a request on this client,
+        # so it is dropped instead of being handed to the next caller
+        cancelled = True
+        raise
+    finally:
+        if not cancelled and pooled and len(idle) < POOL_IDLE_MAX:
+            idle.append(_reset_client(client))
+        # Anything written through this client makes cached reads stale
+        if client_class is ReadWrite:
+            cache_invalidate(evidence)
+
+
+def get_readonly_client(evidence: str) -> contextlib.AbstractContextManager[ReadOnly]:
+    """Borrow a read-only AbraFlexi client for the specified evidence.
+    
+    Args:
+        evidence: Evidence name (e.g., 'faktura-vydana', 'adresar')
+        
+    Returns:
+        Context manager yielding a configured ReadOnly client
+    """
+    return _checkout_client(ReadOnly, evidence)
+
+
+def get_readwrite_client(evidence: str) -> contextlib.AbstractContextManager[ReadWrite]:
+    """Borrow a read-write AbraFlexi client for the specified evidence.
+    
+    Args:
+        evidence: Evidence name (e.g., 'faktura-vydana', 'adresar')
+        
+    Returns:
+        Context manager yielding a configured ReadWrite client
+    """
+    return _checkout_client(ReadWrite, evidence)
+
+
+def cache_get(key: Tuple[Any, ...]) -> Optional[str]:
+    """Get a cached tool response.
+    
+    Args:
+        key: Cache key; the first item is the evidence name
+        
+    Returns:
+        Optional[str]: Cached response, or None if missing or expired
+    """
+    entry = _response_cache.get(key)
+    if entry is None:
+        return None
+    if entry[0] < time.monotonic():
+        del _response_cache[key]
+        return None
+    return entry[1]
+
+
+def cache_generation(evidence: str) -> Tuple[int, int]:
+    """Get the invalidation generation of an evidence's cached responses.
+    
+    Args:
+        evidence: Evidence name
+        
+    Returns:
+        Tuple[int, int]: Whole-cache and per-evidence invalidation counters
+    """
+    return _cache_generations.get(None, 0), _cache_generations.get(evidence, 0)
+
+
+def cache_put(
+    key: Tuple[Any, ...],
+    response: str,
+    generation: Optional[Tuple[int, int]] = None
+) -> str:
+    """Store a tool response in the cache, evicting the oldest entries.
+    
+    Args:
+        key: Cache key; the first item is the evidence name
+        response: Formatted tool response
+        generation: cache_generation() taken before the response was fetched;
+            the response is not stored if the evidence was invalidated since
+        
+    Returns:
+        str: The response, unchanged
+    """
+    if generation is not None and generation != cache_generation(key[0]):
+        return response
+    if CACHE_TTL > 0:
+        _response_cache.pop(key, None)
+        _response_cache[key] = (time.monotonic() + CACHE_TTL, response)
+        while len(_response_cache) > CACHE_SIZE:
+            del _response_cache[next(iter(_response_cache))]
+    return response
 
 
-def get_readwrite_client(evidence: str) -> ReadWrite:
-    """Create a read-write AbraFlexi client for the specified evidence.
+def cache_invalidate(evidence: Optional[str] = None) -> int:
+    """Drop cached responses for one evidence, or all of them.
+    
+    Args:
+        evidence: Evidence name; None clears the whole cache
+        
+    Returns:
+        int: Number of dropped entries
+    """
+    _cache_generations[evidence] = _cache_generations.get(evidence, 0) + 1
+    if evidence is None:
+        count = len(_response_cache)
+        _response_cache.clear()
+        return count
+    stale = [key for key in _response_cache if key[0] == evidence]
+    for key in stale:
+        del _response_cache[key]
+    return len(stale)
+
+
+async def read_records(
+    evidence: str,
+    query_filter: Optional[str],
+    limit: Optional[int],
+    detail: str
+) -> str:
+    """Get records from an evidence, serving repeated queries from the cache.
     
     Args:
         evidence: Evidence name (e.g., 'faktura-vydana', 'adresar')
+        query_filter: AbraFlexi filter expression
+        limit: Maximum number of results
+        detail: Detail level (summary, id, full, custom:field1,field2)
         
     Returns:
-        ReadWrite: Configured AbraFlexi client
+        str: JSON formatted list of records
     """
-    config = get_abraflexi_config()
-    options = {**config, "evidence": evidence}
-    return ReadWrite(None, options)
+    limit = _as_int(limit)
+    key = (evidence, query_filter, limit, detail)
+    cached = cache_get(key)
+    if cached is not None:
+        return cached
+    
+    generation = cache_generation(evidence)
+    with get_readonly_client(evidence) as client:
+        client.filter = query_filter
+        client.default_url_params.update(
+            {"detail": detail, "limit": limit} if limit else {"detail": detail}
+        )
+        
+        result = await asyncio.to_thread(client.get_all_from_abraflexi)
+    
+    return cache_put(key, format_response(result), generation)
 
 
 def is_read_only() -> bool:
@@ -113,12 +397,31 @@ def is_read_only() -> bool:
     Returns:
         bool: True if read-only mode is enabled
     """
-    return os.getenv("READ_ONLY", "true").lower() in ("true", "1", "yes")
+    return _READ_ONLY
+
+
+def format_compact(data: Any) -> str:
+    """Format data as compact single-line JSON.
+    
+    Uses orjson when it is installed and falls back to the stdlib json module.
+    
+    Args:
+        data: Data to format
+        
+    Returns:
+        str: JSON string without whitespace or newlines
+    """
+    if orjson is not None:
+        return _orjson_compact(data).decode()
+    return _json_compact(data)
 
 
 def format_response(data: Any) -> str:
     """Format response data as JSON string.
     
+    Tool output is consumed by programs, so it is compact unless
+    ABRAFLEXI_MCP_PRETTY_JSON is enabled.
+    
     Args:
         data: Data to format
         
@@ -126,8 +429,95 @@ def format_response(data: Any) -> str:
         str: JSON formatted string
     """
     if isinstance(data, bool):
-        return json.dumps({"success": data})
-    return json.dumps(data, indent=2, default=str, ensure_ascii=False)
+        data = {"success": data}
+    if not _PRETTY_JSON:
+        return format_compact(data)
+    if orjson is not None:
+        return _orjson_pretty(data).decode()
+    return _json_pretty(data)
+
+
+def format_created(result: Any, record_id: Optional[int], kod: Optional[str] = None) -> str:
+    """Format the result of a create tool.
+    
+    The response always has the same small shape, so the compact form is
+    built directly instead of going through the JSON encoder.
+    
+    Args:
+        result: Result returned by the AbraFlexi insert
+        record_id: ID of the created record
+        kod: Code of the created record
+        
+    Returns:
+        str: JSON with "success", "id" and, when given, "kod"
+    """
+    if _PRETTY_JSON:
+        response = {"success": bool(result), "id": record_id}
+        if kod is not None:
+            response["kod"] = kod
+        return format_response(response)
+    
+    body = '{"success":' + ("true" if result else "false")
+    body += ',"id":' + (str(int(record_id)) if record_id is not None else "null")
+    if kod is not None:
+        body += ',"kod":' + format_compact(kod)
+    return body + "}"
+
+
+def normalize_ids(ids: List[str]) -> str:
+    """Validate record IDs and join them into a comma separated list.
+    
+    Args:
+        ids: Record IDs
+        
+    Returns:
+        str: IDs normalized to plain integers, joined by commas
+        
+    Raises:
+        ValueError: If any ID is not an integer
+    """
+    normalized = []
+    for record_id in ids:
+        try:
+            normalized.append(str(int(record_id)))
+        except (TypeError, ValueError):
+            raise ValueError(f"Invalid record ID: {record_id!r}") from None
+    return ",".join(normalized)
+
+
+def build_filter(
+    ids: Optional[List[str]] = None,
+    kod: Optional[str] = None,
+    nazev: Optional[str] = None
+) -> Optional[str]:
+    """Build an AbraFlexi filter expression from the common lookup arguments.
+    
+    Args:
+        ids: Record IDs to match
+        kod: Record code to match exactly
+        nazev: Record name to match partially
+        
+    Returns:
+        Optional[str]: Filter expression, or None when no argument is given
+        
+    Raises:
+        ValueError: If any ID is not an integer
+    """
+    id_filter = None
+    if ids:
+        joined = normalize_ids(ids)
+        id_filter = "id=" + joined if len(ids) == 1 else "id in (" + joined + ")"
+    
+    # Lookup by IDs alone is the common case
+    if not kod and not nazev:
+        return id_filter
+    
+    filters = [id_filter] if id_filter else []
+    if kod:
+        filters.append(f"kod='{kod}'")
+    if nazev:
+        filters.append(f"nazev like '*{nazev}*'")
+    return " AND ".join(filters)
 
 
 def validate_read_only() -> None:
@@ -136,13 +526,164 @@ def validate_read_only() -> None:
     Raises:
         ValueError: If server is in read-only mode
     """
-    if is_read_only():
+    if _READ_ONLY:
         raise ValueError("Server is in read-only mode - write operations are not allowed")
 
 
+def record_identifier(id: Optional[str], kod: Optional[str]) -> Union[int, str]:
+    """Turn the id/kod tool arguments into an AbraFlexi record identifier.
+    
+    Args:
+        id: Record ID
+        kod: Record code (alternative to id)
+        
+    Returns:
+        Union[int, str]: Numeric ID or 'code:' identifier
+        
+    Raises:
+        ValueError: If neither id nor kod is given
+    """
+    if not id and not kod:
+        raise ValueError("Either id or kod must be provided")
+    return int(id) if id else f"code:{kod}"
+
+
+async def create_record(evidence: str, payload: Dict[str, Any], kod: Optional[str] = None) -> str:
+    """Insert a record into an evidence.
+    
+    Args:
+        evidence: Evidence name (e.g., 'faktura-vydana', 'adresar')
+        payload: Record data
+        kod: Code of the new record, echoed in the response
+        
+    Returns:
+        str: JSON formatted creation result
+    """
+    with get_readwrite_client(evidence) as client:
+        result = await asyncio.to_thread(client.insert_to_abraflexi, payload)
+
+        return format_created(result, client.last_inserted_id, kod)
+
+
+async def update_record(
+    evidence: str,
+    id: Optional[str],
+    kod: Optional[str],
+    data: Optional[Dict[str, Any]],
+    not_found: str
+) -> str:
+    """Update fields of a record addressed by id or kod.
+    
+    Args:
+        evidence: Evidence name (e.g., 'faktura-vydana', 'adresar')
+        id: Record ID
+        kod: Record code (alternative to id)
+        data: Fields to update
+        not_found: Error message prefix used when the record does not exist
+        
+    Returns:
+        str: JSON formatted update result
+    """
+    identifier = record_identifier(id, kod)
+    # AbraFlexi import creates missing records unless told to fail
+    payload = {**(data or {}), "@create": "fail"}
+    with get_readwrite_client(evidence) as client:
+        result = await _write_record(
+            client, identifier, not_found, client.update, payload
+        )
+        
+        return format_response({"success": result})
+
+
+async def delete_record(
+    evidence: str,
+    id: Optional[str],
+    kod: Optional[str],
+    not_found: str
+) -> str:
+    """Delete a record addressed by id or kod.
+    
+    Args:
+        evidence: Evidence name (e.g., 'faktura-vydana', 'adresar')
+        id: Record ID
+        kod: Record code (alternative to id)
+        not_found: Error message prefix used when the record does not exist
+        
+    Returns:
+        str: JSON formatted deletion result
+    """
+    identifier = record_identifier(id, kod)
+    with get_readwrite_client(evidence) as client:
+        result = await _write_record(client, identifier, not_found, client.delete)
+        
+        return format_response({"success": result})
+
+
+async def _write_record(
+    client: ReadWrite,
+    identifier: Union[int, str],
+    not_found: str,
+    operation: Callable[..., Any],
+    *args: Any
+) -> Any:
+    """Run a write operation against a single record addressed by identifier.
+    
+    The record is not loaded beforehand. AbraFlexi answers 404 for a missing
+    record, and when a write fails for another reason the record's existence
+    is checked, so a missing record is reported as ValueError either way.
+    
+    Args:
+        client: Read-write AbraFlexi client
+        identifier: Record ID or 'code:' identifier
+        not_found: Error message prefix used when the record does not exist
+        operation: Bound client method to call (e.g. client.update)
+        *args: Arguments passed to the operation
+        
+    Returns:
+        Any: Result of the operation
+        
+    Raises:
+        ValueError: If the record does not exist
+    """
+    client.my_key = identifier
+    client._update_api_url()
+    try:
+        result = await asyncio.to_thread(operation, *args)
+    except NotFoundException:
+        raise ValueError(f"{not_found}: {identifier}") from None
+    except AbraFlexiException:
+        try:
+            exists = await asyncio.to_thread(_record_exists, client)
+        except AbraFlexiException:
+            exists = True
+        if not exists:
+            raise ValueError(f"{not_found}: {identifier}") from None
+        raise
+    if client.last_response_code == 404:
+        raise ValueError(f"{not_found}: {identifier}")
+    return result
+
+
+def _record_exists(client: ReadWrite) -> bool:
+    """Check whether the record addressed by the client's key exists.
+    
+    Args:
+        client: Read-write AbraFlexi client with my_key set
+        
+    Returns:
+        bool: True if AbraFlexi returns the record
+    """
+    client.post_fields = None
+    client.default_url_params["detail"] = "id"
+    try:
+        return bool(client.perform_request())
+    except NotFoundException:
+        return False
+
+
 # ISSUED INVOICES (Faktura Vydaná)
 @mcp.tool()
-def invoice_issued_get(
+async def invoice_issued_get(
     ids: Optional[List[str]] = None,
     kod: Optional[str] = None,
     limit: Optional[int] = None,
@@ -159,28 +700,11 @@ def invoice_issued_get(
     Returns:
         str: JSON formatted list of invoices
     """
-    client = get_readonly_client("faktura-vydana")
-    
-    # Build filter
-    filters = []
-    if ids:
-        filters.append(f"id in ({','.join(ids)})")
-    if kod:
-        filters.append(f"kod='{kod}'")
-    
-    if filters:
-        client.filter = " AND ".join(filters)
-    
-    client.default_url_params["detail"] = detail
-    if limit:
-        client.default_url_params["limit"] = limit
-    
-    result = client.get_all_from_abraflexi()
-    return format_response(result)
+    return await read_records("faktura-vydana", build_filter(ids, kod), limit, detail)
 
 
 @mcp.tool()
-def invoice_issued_create(
+async def invoice_issued_create(
     kod: str,
     firma: str,
     datum_vystaveni: Optional[str] = None,
@@ -201,34 +725,24 @@ def invoice_issued_create(
     """
     validate_read_only()
     
-    client = get_readwrite_client("faktura-vydana")
-    
     # Set required fields
-    client.set_data_value("kod", kod)
-    client.set_data_value("firma", firma)
+    payload: Dict[str, Any] = {"kod": kod, "firma": firma}
     
     if datum_vystaveni:
-        client.set_data_value("datVyst", datum_vystaveni)
+        payload["datVyst"] = datum_vystaveni
     
     if polozky:
-        client.set_data_value("polozkyFaktury", polozky)
+        payload["polozkyFaktury"] = polozky
     
     # Set additional fields
     if extra_fields:
-        for key, value in extra_fields.items():
-            client.set_data_value(key, value)
-    
-    result = client.insert_to_abraflexi()
+        payload.update(extra_fields)
     
-    return format_response({
-        "success": result,
-        "id": client.last_inserted_id,
-        "kod": kod
-    })
+    return await create_record("faktura-vydana", payload, kod)
 
 
 @mcp.tool()
-def invoice_issued_update(
+async def invoice_issued_update(
     id: Optional[str] = None,
     kod: Optional[str] = None,
     data: Optional[Dict[str, Any]] = None
@@ -245,28 +759,11 @@ def invoice_issued_update(
     """
     validate_read_only()
     
-    if not id and not kod:
-        raise ValueError("Either id or kod must be provided")
-    
-    identifier = int(id) if id else f"code:{kod}"
-    client = get_readwrite_client("faktura-vydana")
-    
-    # Load existing invoice
-    if not client.load_from_abraflexi(identifier):
-        raise ValueError(f"Invoice not found: {identifier}")
-    
-    # Update fields
-    if data:
-        for key, value in data.items():
-            client.set_data_value(key, value)
-    
-    result = client.update()
-    
-    return format_response({"success": result})
+    return await update_record("faktura-vydana", id, kod, data, "Invoice not found")
 
 
 @mcp.tool()
-def invoice_issued_delete(id: Optional[str] = None, kod: Optional[str] = None) -> str:
+async def invoice_issued_delete(id: Optional[str] = None, kod: Optional[str] = None) -> str:
     """Delete an issued invoice from AbraFlexi.
     
     Args:
@@ -278,24 +775,12 @@ def invoice_issued_delete(id: Optional[str] = None, kod: Optional[str] = None) -
     """
     validate_read_only()
     
-    if not id and not kod:
-        raise ValueError("Either id or kod must be provided")
-    
-    identifier = int(id) if id else f"code:{kod}"
-    client = get_readwrite_client("faktura-vydana")
-    
-    # Load and delete
-    if not client.load_from_abraflexi(identifier):
-        raise ValueError(f"Invoice not found: {identifier}")
-    
-    result = client.delete()
-    
-    return format_response({"success": result})
+    return await delete_record("faktura-vydana", id, kod, "Invoice not found")
 
 
 # RECEIVED INVOICES (Faktura Přijatá)
 @mcp.tool()
-def invoice_received_get(
+async def invoice_received_get(
     ids: Optional[List[str]] = None,
     kod: Optional[str] = None,
     limit: Optional[int] = None,
@@ -312,28 +797,11 @@ def invoice_received_get(
     Returns:
         str: JSON formatted list of invoices
     """
-    client = get_readonly_client("faktura-prijata")
-    
-    # Build filter
-    filters = []
-    if ids:
-        filters.append(f"id in ({','.join(ids)})")
-    if kod:
-        filters.append(f"kod='{kod}'")
-    
-    if filters:
-        client.filter = " AND ".join(filters)
-    
-    client.default_url_params["detail"] = detail
-    if limit:
-        client.default_url_params["limit"] = limit
-    
-    result = client.get_all_from_abraflexi()
-    return format_response(result)
+    return await read_records("faktura-prijata", build_filter(ids, kod), limit, detail)
 
 
 @mcp.tool()
-def invoice_received_create(
+async def invoice_received_create(
     kod: str,
     firma: str,
     datum_vystaveni: Optional[str] = None,
@@ -354,35 +822,25 @@ def invoice_received_create(
     """
     validate_read_only()
     
-    client = get_readwrite_client("faktura-prijata")
-    
     # Set required fields
-    client.set_data_value("kod", kod)
-    client.set_data_value("firma", firma)
+    payload: Dict[str, Any] = {"kod": kod, "firma": firma}
     
     if datum_vystaveni:
-        client.set_data_value("datVyst", datum_vystaveni)
+        payload["datVyst"] = datum_vystaveni
     
     if polozky:
-        client.set_data_value("polozkyFaktury", polozky)
+        payload["polozkyFaktury"] = polozky
     
     # Set additional fields
     if extra_fields:
-        for key, value in extra_fields.items():
-            client.set_data_value(key, value)
+        payload.update(extra_fields)
     
-    result = client.insert_to_abraflexi()
-    
-    return format_response({
-        "success": result,
-        "id": client.last_inserted_id,
-        "kod": kod
-    })
+    return await create_record("faktura-prijata", payload, kod)
 
 
 # CONTACTS/COMPANIES (Adresář)
 @mcp.tool()
-def contact_get(
+async def contact_get(
     ids: Optional[List[str]] = None,
     kod: Optional[str] = None,
     nazev: Optional[str] = None,
@@ -401,30 +859,11 @@ def contact_get(
     Returns:
         str: JSON formatted list of contacts
     """
-    client = get_readonly_client("adresar")
-    
-    # Build filter
-    filters = []
-    if ids:
-        filters.append(f"id in ({','.join(ids)})")
-    if kod:
-        filters.append(f"kod='{kod}'")
-    if nazev:
-        filters.append(f"nazev like '*{nazev}*'")
-    
-    if filters:
-        client.filter = " AND ".join(filters)
-    
-    client.default_url_params["detail"] = detail
-    if limit:
-        client.default_url_params["limit"] = limit
-    
-    result = client.get_all_from_abraflexi()
-    return format_response(result)
+    return await read_records("adresar", build_filter(ids, kod, nazev), limit, detail)
 
 
 @mcp.tool()
-def contact_create(
+async def contact_create(
     kod: str,
     nazev: str,
     email: Optional[str] = None,
@@ -445,33 +884,23 @@ def contact_create(
     """
     validate_read_only()
     
-    client = get_readwrite_client("adresar")
-    
     # Set required fields
-    client.set_data_value("kod", kod)
-    client.set_data_value("nazev", nazev)
+    payload: Dict[str, Any] = {"kod": kod, "nazev": nazev}
     
     if email:
-        client.set_data_value("email", email)
+        payload["email"] = email
     if tel:
-        client.set_data_value("tel", tel)
+        payload["tel"] = tel
     
     # Set additional fields
     if extra_fields:
-        for key, value in extra_fields.items():
-            client.set_data_value(key, value)
-    
-    result = client.insert_to_abraflexi()
+        payload.update(extra_fields)
     
-    return format_response({
-        "success": result,
-        "id": client.last_inserted_id,
-        "kod": kod
-    })
+    return await create_record("adresar", payload, kod)
 
 
 @mcp.tool()
-def contact_update(
+async def contact_update(
     id: Optional[str] = None,
     kod: Optional[str] = None,
     data: Optional[Dict[str, Any]] = None
@@ -488,28 +917,11 @@ def contact_update(
     """
     validate_read_only()
     
-    if not id and not kod:
-        raise ValueError("Either id or kod must be provided")
-    
-    identifier = int(id) if id else f"code:{kod}"
-    client = get_readwrite_client("adresar")
-    
-    # Load existing contact
-    if not client.load_from_abraflexi(identifier):
-        raise ValueError(f"Contact not found: {identifier}")
-    
-    # Update fields
-    if data:
-        for key, value in data.items():
-            client.set_data_value(key, value)
-    
-    result = client.update()
-    
-    return format_response({"success": result})
+    return await update_record("adresar", id, kod, data, "Contact not found")
 
 
 @mcp.tool()
-def contact_delete(id: Optional[str] = None, kod: Optional[str] = None) -> str:
+async def contact_delete(id: Optional[str] = None, kod: Optional[str] = None) -> str:
     """Delete a contact/company from AbraFlexi.
     
     Args:
@@ -521,24 +933,12 @@ def contact_delete(id: Optional[str] = None, kod: Optional[str] = None) -> str:
     """
     validate_read_only()
     
-    if not id and not kod:
-        raise ValueError("Either id or kod must be provided")
-    
-    identifier = int(id) if id else f"code:{kod}"
-    client = get_readwrite_client("adresar")
-    
-    # Load and delete
-    if not client.load_from_abraflexi(identifier):
-        raise ValueError(f"Contact not found: {identifier}")
-    
-    result = client.delete()
-    
-    return format_response({"success": result})
+    return await delete_record("adresar", id, kod, "Contact not found")
 
 
 # PRODUCTS (Ceník)
 @mcp.tool()
-def product_get(
+async def product_get(
     ids: Optional[List[str]] = None,
     kod: Optional[str] = None,
     nazev: Optional[str] = None,
@@ -557,30 +957,11 @@ def product_get(
     Returns:
         str: JSON formatted list of products
     """
-    client = get_readonly_client("cenik")
-    
-    # Build filter
-    filters = []
-    if ids:
-        filters.append(f"id in ({','.join(ids)})")
-    if kod:
-        filters.append(f"kod='{kod}'")
-    if nazev:
-        filters.append(f"nazev like '*{nazev}*'")
-    
-    if filters:
-        client.filter = " AND ".join(filters)
-    
-    client.default_url_params["detail"] = detail
-    if limit:
-        client.default_url_params["limit"] = limit
-    
-    result = client.get_all_from_abraflexi()
-    return format_response(result)
+    return await read_records("cenik", build_filter(ids, kod, nazev), limit, detail)
 
 
 @mcp.tool()
-def product_create(
+async def product_create(
     kod: str,
     nazev: str,
     cena: Optional[float] = None,
@@ -599,31 +980,21 @@ def product_create(
     """
     validate_read_only()
     
-    client = get_readwrite_client("cenik")
-    
     # Set required fields
-    client.set_data_value("kod", kod)
-    client.set_data_value("nazev", nazev)
+    payload: Dict[str, Any] = {"kod": kod, "nazev": nazev}
     
     if cena is not None:
-        client.set_data_value("cenaZakl", cena)
+        payload["cenaZakl"] = cena
     
     # Set additional fields
     if extra_fields:
-        for key, value in extra_fields.items():
-            client.set_data_value(key, value)
-    
-    result = client.insert_to_abraflexi()
+        payload.update(extra_fields)
     
-    return format_response({
-        "success": result,
-        "id": client.last_inserted_id,
-        "kod": kod
-    })
+    return await create_record("cenik", payload, kod)
 
 
 @mcp.tool()
-def product_update(
+async def product_update(
     id: Optional[str] = None,
     kod: Optional[str] = None,
     data: Optional[Dict[str, Any]] = None
@@ -640,28 +1011,11 @@ def product_update(
     """
     validate_read_only()
     
-    if not id and not kod:
-        raise ValueError("Either id or kod must be provided")
-    
-    identifier = int(id) if id else f"code:{kod}"
-    client = get_readwrite_client("cenik")
-    
-    # Load existing product
-    if not client.load_from_abraflexi(identifier):
-        raise ValueError(f"Product not found: {identifier}")
-    
-    # Update fields
-    if data:
-        for key, value in data.items():
-            client.set_data_value(key, value)
-    
-    result = client.update()
-    
-    return format_response({"success": result})
+    return await update_record("cenik", id, kod, data, "Product not found")
 
 
 @mcp.tool()
-def product_delete(id: Optional[str] = None, kod: Optional[str] = None) -> str:
+async def product_delete(id: Optional[str] = None, kod: Optional[str] = None) -> str:
     """Delete a product from AbraFlexi.
     
     Args:
@@ -673,24 +1027,12 @@ def product_delete(id: Optional[str] = None, kod: Optional[str] = None) -> str:
     """
     validate_read_only()
     
-    if not id and not kod:
-        raise ValueError("Either id or kod must be provided")
-    
-    identifier = int(id) if id else f"code:{kod}"
-    client = get_readwrite_client("cenik")
-    
-    # Load and delete
-    if not client.load_from_abraflexi(identifier):
-        raise ValueError(f"Product not found: {identifier}")
-    
-    result = client.delete()
-    
-    return format_response({"success": result})
+    return await delete_record("cenik", id, kod, "Product not found")
 
 
 # BANK TRANSACTIONS (Banka)
 @mcp.tool()
-def bank_transaction_get(
+async def bank_transaction_get(
     ids: Optional[List[str]] = None,
     limit: Optional[int] = None,
     detail: str = "summary"
@@ -705,22 +1047,11 @@ def bank_transaction_get(
     Returns:
         str: JSON formatted list of bank transactions
     """
-    client = get_readonly_client("banka")
-    
-    # Build filter
-    if ids:
-        client.filter = f"id in ({','.join(ids)})"
-    
-    client.default_url_params["detail"] = detail
-    if limit:
-        client.default_url_params["limit"] = limit
-    
-    result = client.get_all_from_abraflexi()
-    return format_response(result)
+    return await read_records("banka", build_filter(ids), limit, detail)
 
 
 @mcp.tool()
-def bank_transaction_create(
+async def bank_transaction_create(
     banka: str,
     datum: str,
     castka: float,
@@ -741,32 +1072,22 @@ def bank_transaction_create(
     """
     validate_read_only()
     
-    client = get_readwrite_client("banka")
-    
     # Set required fields
-    client.set_data_value("banka", banka)
-    client.set_data_value("datum", datum)
-    client.set_data_value("castka", castka)
+    payload: Dict[str, Any] = {"banka": banka, "datum": datum, "castka": castka}
     
     if popis:
-        client.set_data_value("popis", popis)
+        payload["popis"] = popis
     
     # Set additional fields
     if extra_fields:
-        for key, value in extra_fields.items():
-            client.set_data_value(key, value)
-    
-    result = client.insert_to_abraflexi()
+        payload.update(extra_fields)
     
-    return format_response({
-        "success": result,
-        "id": client.last_inserted_id
-    })
+    return await create_record("banka", payload)
 
 
 # GENERIC EVIDENCE OPERATIONS
 @mcp.tool()
-def evidence_get(
+async def evidence_get(
     evidence: str,
     ids: Optional[List[str]] = None,
     filter_expr: Optional[str] = None,
@@ -785,24 +1106,61 @@ def evidence_get(
     Returns:
         str: JSON formatted list of records
     """
-    client = get_readonly_client(evidence)
+    return await read_records(evidence, build_filter(ids) if ids else filter_expr, limit, detail)
+
+
+@mcp.tool()
+async def evidence_get_stream(
+    evidence: str,
+    filter_expr: Optional[str] = None,
+    limit: Optional[int] = None,
+    page_size: int = 100,
+    detail: str = "summary"
+) -> str:
+    """Get records from any AbraFlexi evidence as newline-delimited JSON.
     
-    # Build filter
-    if ids:
-        client.filter = f"id in ({','.join(ids)})"
-    elif filter_expr:
-        client.filter = filter_expr
+    Pages through the evidence and serializes every page as it arrives, so
+    large evidences are never held in memory as a single list of records.
     
-    client.default_url_params["detail"] = detail
+    Args:
+        evidence: Evidence name (e.g., 'faktura-vydana', 'adresar', 'cenik')
+        filter_expr: AbraFlexi filter expression
+        limit: Maximum number of results (all records if not set)
+        page_size: Number of records fetched per request
+        detail: Detail level (summary, id, full, custom:field1,field2)
+        
+    Returns:
+        str: One JSON formatted record per line (NDJSON)
+        
+    Raises:
+        ValueError: If page_size or limit is less than 1
+    """
+    limit = _as_int(limit)
+    page_size = _as_int(page_size, 100)
+    # AbraFlexi treats limit=0 as "all records", so paging would never advance
+    if page_size < 1:
+        raise ValueError(f"page_size must be at least 1, got {page_size}")
+    if limit is not None and limit < 1:
+        raise ValueError(f"limit must be at least 1, got {limit}")
     if limit:
-        client.default_url_params["limit"] = limit
-    
-    result = client.get_all_from_abraflexi()
-    return format_response(result)
+        page_size = min(page_size, limit)
+    
+    def collect(client: ReadOnly) -> str:
+        records = client.iterate_all(page_size)
+        if limit:
+            records = itertools.islice(records, limit)
+        return "\n".join(map(format_compact, records))
+    
+    with get_readonly_client(evidence) as client:
+        if filter_expr:
+            client.filter = filter_expr
+        client.default_url_params["detail"] = detail
+        
+        return await asyncio.to_thread(collect, client)
 
 
 @mcp.tool()
-def evidence_create(evidence: str, data: Dict[str, Any]) -> str:
+async def evidence_create(evidence: str, data: Dict[str, Any]) -> str:
     """Create a new record in any AbraFlexi evidence.
     
     Args:
@@ -814,22 +1172,11 @@ def evidence_create(evidence: str, data: Dict[str, Any]) -> str:
     """
     validate_read_only()
     
-    client = get_readwrite_client(evidence)
-    
-    # Set all data fields
-    for key, value in data.items():
-        client.set_data_value(key, value)
-    
-    result = client.insert_to_abraflexi()
-    
-    return format_response({
-        "success": result,
-        "id": client.last_inserted_id
-    })
+    return await create_record(evidence, data)
 
 
 @mcp.tool()
-def evidence_update(
+async def evidence_update(
     evidence: str,
     id: Optional[str] = None,
     kod: Optional[str] = None,
@@ -848,28 +1195,11 @@ def evidence_update(
     """
     validate_read_only()
     
-    if not id and not kod:
-        raise ValueError("Either id or kod must be provided")
-    
-    identifier = int(id) if id else f"code:{kod}"
-    client = get_readwrite_client(evidence)
-    
-    # Load existing record
-    if not client.load_from_abraflexi(identifier):
-        raise ValueError(f"Record not found in {evidence}: {identifier}")
-    
-    # Update fields
-    if data:
-        for key, value in data.items():
-            client.set_data_value(key, value)
-    
-    result = client.update()
-    
-    return format_response({"success": result})
+    return await update_record(evidence, id, kod, data, f"Record not found in {evidence}")
 
 
 @mcp.tool()
-def evidence_delete(
+async def evidence_delete(
     evidence: str,
     id: Optional[str] = None,
     kod: Optional[str] = None
@@ -886,19 +1216,139 @@ def evidence_delete(
     """
     validate_read_only()
     
-    if not id and not kod:
-        raise ValueError("Either id or kod must be provided")
+    return await delete_record(evidence, id, kod, f"Record not found in {evidence}")
+
+
+@mcp.tool()
+async def evidence_bulk_get(
+    evidence: str,
+    ids: List[str],
+    detail: str = "summary"
+) -> str:
+    """Get many records from any AbraFlexi evidence by ID in one call.
     
-    identifier = int(id) if id else f"code:{kod}"
-    client = get_readwrite_client(evidence)
+    The IDs are split into chunks that are fetched concurrently.
     
-    # Load and delete
-    if not client.load_from_abraflexi(identifier):
-        raise ValueError(f"Record not found in {evidence}: {identifier}")
+    Args:
+        evidence: Evidence name (e.g., 'faktura-vydana', 'adresar', 'cenik')
+        ids: List of record IDs to retrieve
+        detail: Detail level (summary, id, full, custom:field1,field2)
+        
+    Returns:
+        str: JSON formatted list of records
+        
+    Raises:
+        ValueError: If any ID is not an integer
+    """
+    # Reject bad IDs before any chunk starts its request
+    normalize_ids(ids)
+    semaphore = asyncio.Semaphore(BULK_CONCURRENCY)
     
-    result = client.delete()
+    async def fetch(chunk: List[str]) -> List[Dict[str, Any]]:
+        async with semaphore:
+            with get_readonly_client(evidence) as client:
+                client.filter = build_filter(chunk)
+                client.default_url_params["detail"] = detail
+                client.default_url_params["limit"] = len(chunk)
+                return await asyncio.to_thread(client.get_all_from_abraflexi)
     
-    return format_response({"success": result})
+    pages = await asyncio.gather(*(
+        fetch(ids[start:start + BULK_CHUNK_SIZE])
+        for start in range(0, len(ids), BULK_CHUNK_SIZE)
+    ))
+    
+    return format_response([record for page in pages for record in page])
+
+
+@mcp.tool()
+async def evidence_bulk_create(evidence: str, records: List[Dict[str, Any]]) -> str:
+    """Create many records in any AbraFlexi evidence in one call.
+    
+    The records are split into chunks that are inserted concurrently, each
+    chunk as a single batch request. Chunks are independent: a failed chunk
+    is reported in "errors" (with the index of its first record) while the
+    IDs created by the other chunks are still returned.
+    
+    Args:
+        evidence: Evidence name (e.g., 'faktura-vydana', 'adresar', 'cenik')
+        records: List of records, each as a dictionary
+        
+    Returns:
+        str: JSON formatted creation result with the new record IDs and
+            per-chunk errors
+    """
+    validate_read_only()
+    
+    semaphore = asyncio.Semaphore(BULK_CONCURRENCY)
+    
+    async def insert(chunk: List[Dict[str, Any]]) -> Any:
+        async with semaphore:
+            with get_readwrite_client(evidence) as client:
+                return await asyncio.to_thread(client.batch_insert, chunk)
+    
+    starts = range(0, len(records), BULK_CHUNK_SIZE)
+    results = await asyncio.gather(
+        *(insert(records[start:start + BULK_CHUNK_SIZE]) for start in starts),
+        return_exceptions=True
+    )
+    
+    errors = [
+        {
+            "start": start,
+            "count": len(records[start:start + BULK_CHUNK_SIZE]),
+            "error": str(result)
+        }
+        for start, result in zip(starts, results) if isinstance(result, Exception)
+    ]
+    return format_response({
+        "success": not errors and all(results),
+        "ids": [
+            int(row["id"])
+            for result in results if isinstance(result, list)
+            for row in result if "id" in row
+        ],
+        "errors": errors
+    })
+
+
+@mcp.tool()
+def evidence_cache_clear(evidence: Optional[str] = None) -> str:
+    """Clear cached responses of the read tools.
+    
+    Read tools cache their responses for ABRAFLEXI_MCP_CACHE_TTL seconds.
+    Writes made through this server clear the affected evidence
+    automatically; use this tool after changes made elsewhere.
+    
+    Args:
+        evidence: Evidence name to clear (all evidences if not set)
+        
+    Returns:
+        str: JSON formatted result with the number of cleared entries
+    """
+    return format_response({"success": True, "cleared": cache_invalidate(evidence)})
+
+
+# Common AbraFlexi evidences
+EVIDENCES = [
+    {"name": "faktura-vydana", "description": "Issued invoices"},
+    {"name": "faktura-prijata", "description": "Received invoices"},
+    {"name": "adresar", "description": "Contacts and companies"},
+    {"name": "cenik", "description": "Products and services"},
+    {"name": "banka", "description": "Bank transactions"},
+    {"name": "pokladna", "description": "Cash transactions"},
+    {"name": "nabidka-vydana", "description": "Issued quotes"},
+    {"name": "objednavka-vydana", "description": "Issued orders"},
+    {"name": "objednavka-prijata", "description": "Received orders"},
+    {"name": "dodaci-list", "description": "Delivery notes"},
+    {"name": "sklad", "description": "Warehouse/stock"},
+    {"name": "cenova-uroven", "description": "Price levels"},
+    {"name": "typ-smlouvy", "description": "Contract types"},
+]
+
+_EVIDENCE_NAMES = frozenset(ev["name"] for ev in EVIDENCES)
+
+# The list never changes, so it is serialized only once
+_EVIDENCE_LIST_JSON = format_response(EVIDENCES)
 
 
 @mcp.tool()
@@ -908,28 +1358,20 @@ def evidence_list() -> str:
     Returns:
         str: JSON formatted list of evidence names
     """
-    # Common AbraFlexi evidences
-    evidences = [
-        {"name": "faktura-vydana", "description": "Issued invoices"},
-        {"name": "faktura-prijata", "description": "Received invoices"},
-        {"name": "adresar", "description": "Contacts and companies"},
-        {"name": "cenik", "description": "Products and services"},
-        {"name": "banka", "description": "Bank transactions"},
-        {"name": "pokladna", "description": "Cash transactions"},
-        {"name": "nabidka-vydana", "description": "Issued quotes"},
-        {"name": "objednavka-vydana", "description": "Issued orders"},
-        {"name": "objednavka-prijata", "description": "Received orders"},
-        {"name": "dodaci-list", "description": "Delivery notes"},
-        {"name": "sklad", "description": "Warehouse/stock"},
-        {"name": "cenova-uroven", "description": "Price levels"},
-        {"name": "typ-smlouvy", "description": "Contract types"},
-    ]
-    
-    return format_response(evidences)
+    return _EVIDENCE_LIST_JSON
 
 
 def main():
     """Main entry point for the MCP server."""
+    # Configure logging only when run as a server, not when imported
+    logging.basicConfig(
+        level=logging.INFO if os.getenv("DEBUG") else logging.WARNING,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    )
+    
+    # Fail fast on missing AbraFlexi configuration instead of on the first tool call
+    get_abraflexi_config()
+    
     # Get transport configuration
     transport = os.getenv("ABRAFLEXI_MCP_TRANSPORT", "stdio").lower()
     
@@ -937,10 +1379,28 @@ def main():
         # HTTP transport configuration
         host = os.getenv("ABRAFLEXI_MCP_HOST", "127.0.0.1")
         port = int(os.getenv("ABRAFLEXI_MCP_PORT", "8000"))
-        stateless = os.getenv("ABRAFLEXI_MCP_STATELESS_HTTP", "false").lower() in ("true", "1", "yes")
+        stateless = _envbool("ABRAFLEXI_MCP_STATELESS_HTTP")
+        
+        # Serve HTTP on uvloop when the optional speedup is installed. The loop is
+        # handed to anyio (which mcp.run() uses) as a factory rather than through
+        # uvloop.install(), as the event loop policy API is deprecated since 3.12.
+        try:
+            import uvloop
+            backend_options = {"loop_factory": uvloop.new_event_loop}
+        except ImportError:
+            backend_options = {}
         
-        logger.info(f"Starting MCP server with HTTP transport on {host}:{port}")
-        mcp.run(transport="streamable-http", host=host, port=port, stateless=stateless)
+        logger.info("Starting MCP server with HTTP transport on %s:%s", host, port)
+        anyio.run(
+            functools.partial(
+                mcp.run_async,
+                transport="streamable-http",
+                host=host,
+                port=port,
+                stateless_http=stateless,
+            ),
+            backend_options=backend_options,
+        )
     else:
         # Default stdio transport
         logger.info("Starting MCP server with stdio transport")
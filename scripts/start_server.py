@@ -11,21 +11,83 @@ License: MIT
 
 import os
 import sys
-import logging
-from typing import List
-from dotenv import load_dotenv
+import functools
+from types import MappingProxyType, SimpleNamespace
+from typing import Any, Mapping
 
-# Load environment variables from .env file
-load_dotenv()
+
+def _noop(*args, **kwargs) -> None:
+    """Discard a log record."""
+
+
+# Emoji only go to a terminal, not to redirected output or logs
+_TTY = sys.stdout.isatty()
+_ROCKET = "🚀 " if _TTY else ""
+_WAVE = "👋 " if _TTY else ""
+
+# Environment variables the server cannot start without, with their config keys
+_REQUIRED = (("ABRAFLEXI_URL", "url"), ("ABRAFLEXI_COMPANY", "company"))
+
+# Values accepted as true in boolean environment variables (as in the server)
+_TRUE = frozenset(("true", "1", "yes"))
+
+
+def _envbool(name: str, default: str = "false") -> bool:
+    """Parse a boolean environment variable."""
+    return os.environ.get(name, default).lower() in _TRUE
+
+
+def _envint(name: str, default: str) -> int:
+    """Parse an integer environment variable."""
+    value = os.environ.get(name, default)
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError(f"{name} must be an integer, got {value!r}") from None
+
+
+@functools.lru_cache(maxsize=1)
+def _get_config() -> Mapping[str, Any]:
+    """Read the server configuration from the environment once.
+    
+    Returns:
+        Mapping[str, Any]: Read-only configuration with parsed values
+    """
+    env = os.environ
+    return MappingProxyType({
+        "url": env.get("ABRAFLEXI_URL"),
+        "company": env.get("ABRAFLEXI_COMPANY"),
+        "session_id": env.get("ABRAFLEXI_AUTHSESSID"),
+        "user": env.get("ABRAFLEXI_LOGIN"),
+        "password": env.get("ABRAFLEXI_PASSWORD"),
+        "timeout": _envint("ABRAFLEXI_TIMEOUT", "300"),
+        "transport": env.get("ABRAFLEXI_MCP_TRANSPORT", "stdio").lower(),
+        "host": env.get("ABRAFLEXI_MCP_HOST", "127.0.0.1"),
+        "port": _envint("ABRAFLEXI_MCP_PORT", "8000"),
+        "stateless": _envbool("ABRAFLEXI_MCP_STATELESS_HTTP"),
+        "auth_type": env.get("AUTH_TYPE", "").lower(),
+        "read_only": _envbool("READ_ONLY", "true"),
+        "debug": _envbool("DEBUG"),
+    })
+
+
+# Messages are printed anyway, so logging is only set up in DEBUG mode
+logger = SimpleNamespace(debug=_noop, info=_noop, warning=_noop, error=_noop)
 
 
 def setup_logging() -> None:
-    """Setup logging configuration."""
-    log_level = logging.DEBUG if os.getenv("DEBUG") else logging.INFO
+    """Setup logging configuration when DEBUG is enabled."""
+    global logger
+    
+    if not _get_config()["debug"]:
+        return
+    
+    import logging
     logging.basicConfig(
-        level=log_level,
+        level=logging.DEBUG,
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     )
+    logger = logging.getLogger(__name__)
 
 
 def check_environment() -> bool:
@@ -34,13 +96,8 @@ def check_environment() -> bool:
     Returns:
         bool: True if environment is properly configured
     """
-    logger = logging.getLogger(__name__)
-    required_vars = ["ABRAFLEXI_URL", "ABRAFLEXI_COMPANY"]
-    missing_vars: List[str] = []
-    
-    for var in required_vars:
-        if not os.getenv(var):
-            missing_vars.append(var)
+    cfg = _get_config()
+    missing_vars = tuple(var for var, key in _REQUIRED if not cfg[key])
     
     if missing_vars:
         logger.error(f"Missing required environment variables: {', '.join(missing_vars)}")
@@ -51,11 +108,7 @@ def check_environment() -> bool:
         return False
     
     # Check authentication configuration
-    session_id = os.getenv("ABRAFLEXI_AUTHSESSID")
-    user = os.getenv("ABRAFLEXI_LOGIN")
-    password = os.getenv("ABRAFLEXI_PASSWORD")
-    
-    if not session_id and not (user and password):
+    if not cfg["session_id"] and not (cfg["user"] and cfg["password"]):
         logger.error("Authentication not configured")
         print("Error: Authentication not configured")
         print("Please set either:")
@@ -64,98 +117,104 @@ def check_environment() -> bool:
         return False
     
     # Check transport configuration
-    transport = os.getenv("ABRAFLEXI_MCP_TRANSPORT", "stdio").lower()
+    transport = cfg["transport"]
     if transport not in ["stdio", "streamable-http"]:
         logger.error(f"Invalid ABRAFLEXI_MCP_TRANSPORT: {transport}")
         print(f"Error: Invalid ABRAFLEXI_MCP_TRANSPORT: {transport}")
         print("Valid values are: stdio, streamable-http")
         return False
     
-    if transport == "streamable-http":
-        auth_type = os.getenv("AUTH_TYPE", "").lower()
-        if auth_type != "no-auth":
-            logger.error("AUTH_TYPE must be 'no-auth' for streamable-http transport")
-            print("Error: AUTH_TYPE must be set to 'no-auth' when using streamable-http transport")
-            return False
+    if transport == "streamable-http" and cfg["auth_type"] != "no-auth":
+        logger.error("AUTH_TYPE must be 'no-auth' for streamable-http transport")
+        print("Error: AUTH_TYPE must be set to 'no-auth' when using streamable-http transport")
+        return False
     
     return True
 
 
 def show_configuration() -> None:
     """Display current configuration."""
-    logger = logging.getLogger(__name__)
-    
-    print("\n" + "=" * 50)
-    print("AbraFlexi MCP Server Configuration")
-    print("=" * 50)
+    cfg = _get_config()
+    lines = [
+        "",
+        "=" * 50,
+        "AbraFlexi MCP Server Configuration",
+        "=" * 50,
+    ]
     
     # AbraFlexi URL
-    abraflexi_url = os.getenv('ABRAFLEXI_URL', 'Not configured')
-    print(f"AbraFlexi URL: {abraflexi_url}")
+    abraflexi_url = cfg['url'] or 'Not configured'
+    lines.append(f"AbraFlexi URL: {abraflexi_url}")
     logger.info(f"AbraFlexi URL: {abraflexi_url}")
     
     # Company
-    company = os.getenv('ABRAFLEXI_COMPANY', 'Not configured')
-    print(f"Company: {company}")
+    company = cfg['company'] or 'Not configured'
+    lines.append(f"Company: {company}")
     logger.info(f"Company: {company}")
     
     # Authentication method
-    if os.getenv('ABRAFLEXI_AUTHSESSID'):
+    login = cfg['user']
+    if cfg['session_id']:
         auth_method = 'Session ID'
         logger.info("Authentication: Session ID")
-    elif os.getenv('ABRAFLEXI_LOGIN'):
-        auth_method = f"Username/Password ({os.getenv('ABRAFLEXI_LOGIN')})"
-        logger.info(f"Authentication: Username/Password for user {os.getenv('ABRAFLEXI_LOGIN')}")
+    elif login:
+        auth_method = f"Username/Password ({login})"
+        logger.info(f"Authentication: Username/Password for user {login}")
     else:
         auth_method = 'Not configured'
         logger.warning("Authentication: Not configured")
     
-    print(f"Authentication: {auth_method}")
+    lines.append(f"Authentication: {auth_method}")
     
     # Transport configuration
-    transport = os.getenv('ABRAFLEXI_MCP_TRANSPORT', 'stdio')
-    print(f"Transport: {transport}")
+    transport = cfg['transport']
+    lines.append(f"Transport: {transport}")
     logger.info(f"Transport: {transport}")
     
     if transport == 'streamable-http':
-        host = os.getenv('ABRAFLEXI_MCP_HOST', '127.0.0.1')
-        port = os.getenv('ABRAFLEXI_MCP_PORT', '8000')
-        stateless = os.getenv('ABRAFLEXI_MCP_STATELESS_HTTP', 'false')
-        auth_type = os.getenv('AUTH_TYPE', 'Not set')
+        host = cfg['host']
+        port = cfg['port']
+        stateless = 'Enabled' if cfg['stateless'] else 'Disabled'
+        auth_type = cfg['auth_type'] or 'Not set'
         
-        print(f"  - Host: {host}")
-        print(f"  - Port: {port}")
-        print(f"  - Stateless: {stateless}")
-        print(f"  - Auth Type: {auth_type}")
+        lines.append(f"  - Host: {host}")
+        lines.append(f"  - Port: {port}")
+        lines.append(f"  - Stateless: {stateless}")
+        lines.append(f"  - Auth Type: {auth_type}")
         
         logger.info(f"HTTP Transport - Host: {host}, Port: {port}, Stateless: {stateless}, Auth: {auth_type}")
     
     # Read-only mode
-    read_only = os.getenv('READ_ONLY', 'true').lower() in ('true', '1', 'yes')
-    read_only_str = 'Enabled' if read_only else 'Disabled'
-    print(f"Read-only mode: {read_only_str}")
+    read_only_str = 'Enabled' if cfg['read_only'] else 'Disabled'
+    lines.append(f"Read-only mode: {read_only_str}")
     logger.info(f"Read-only mode: {read_only_str}")
     
     # Timeout
-    timeout = os.getenv('ABRAFLEXI_TIMEOUT', '300')
-    print(f"Timeout: {timeout}s")
+    timeout = cfg['timeout']
+    lines.append(f"Timeout: {timeout}s")
     logger.info(f"Timeout: {timeout}s")
     
     # Debug mode
-    debug_mode = os.getenv('DEBUG', 'false').lower() in ('true', '1', 'yes')
-    debug_str = 'Enabled' if debug_mode else 'Disabled'
-    print(f"Debug mode: {debug_str}")
+    debug_str = 'Enabled' if cfg['debug'] else 'Disabled'
+    lines.append(f"Debug mode: {debug_str}")
     logger.info(f"Debug mode: {debug_str}")
     
-    print("=" * 50)
-    print()
+    lines.append("=" * 50)
+    lines.append("")
+    
+    # Write the whole banner at once
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def main() -> None:
     """Main startup function."""
-    # Setup logging first
+    # Load the .env file like the server does (existing variables win),
+    # before logging so DEBUG can come from .env
+    from dotenv import load_dotenv
+    load_dotenv()
+    
+    # Setup logging
     setup_logging()
-    logger = logging.getLogger(__name__)
     
     print("Starting AbraFlexi MCP Server...")
     logger.info("Starting AbraFlexi MCP Server")
@@ -174,9 +233,7 @@ def main() -> None:
         from abraflexi_mcp_server.server import main as server_main
         
         logger.info("Starting MCP server")
-        print("🚀 Starting MCP server...")
-        print("Press Ctrl+C to stop")
-        print()
+        sys.stdout.write(f"{_ROCKET}Starting MCP server...\nPress Ctrl+C to stop\n\n")
         
         server_main()
         
@@ -188,7 +245,7 @@ def main() -> None:
         
     except KeyboardInterrupt:
         logger.info("Server stopped by user")
-        print("\n👋 Server stopped by user")
+        print(f"\n{_WAVE}Server stopped by user")
         
     except Exception as e:
         logger.error(f"Unexpected error: {e}", exc_info=True)
@@ -13,20 +13,58 @@ License: MIT
 import os
 import sys
 import json
+import time
 import asyncio
-import inspect
+import itertools
 from pathlib import Path
 from dotenv import load_dotenv
 
-# Load environment variables
+
+# Status glyphs, replaced by plain words when output is not a terminal
+_TTY = sys.stdout.isatty()
+_OK = "✓" if _TTY else "OK"
+_FAIL = "❌" if _TTY else "FAIL"
+_WARN = "⚠" if _TTY else "WARN"
+_INFO = "ℹ️" if _TTY else "INFO"
+_DONE = "✅" if _TTY else "OK"
+
+# Values accepted as true in boolean environment variables (as in the server)
+_TRUE = frozenset(("true", "1", "yes"))
+
+
+def _envbool(name, default="false"):
+    """Parse a boolean environment variable."""
+    return os.environ.get(name, default).lower() in _TRUE
+
+
+# Load environment variables (existing ones are never overridden)
 load_dotenv()
 
-# Add project root to path (useful when running from the source tree)
+# Add project root to path only when the package is not installed
+# (useful when running from the source tree)
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
-if str(PROJECT_ROOT) not in sys.path:
+try:
+    import abraflexi_mcp_server  # noqa: F401
+except ImportError:
     sys.path.insert(0, str(PROJECT_ROOT))
 
-from python_abraflexi import ReadOnly, ReadWrite
+
+# Tools the server must register
+EXPECTED_TOOLS = frozenset({
+    "invoice_issued_get", "invoice_issued_create",
+    "invoice_issued_update", "invoice_issued_delete",
+    "invoice_received_get", "invoice_received_create",
+    "contact_get", "contact_create",
+    "contact_update", "contact_delete",
+    "product_get", "product_create",
+    "product_update", "product_delete",
+    "bank_transaction_get", "bank_transaction_create",
+    "evidence_get", "evidence_get_stream", "evidence_create",
+    "evidence_update", "evidence_delete",
+    "evidence_bulk_get", "evidence_bulk_create",
+    "evidence_cache_clear",
+    "evidence_list",
+})
 
 
 def _get_tools(mcp_instance):
@@ -36,10 +74,9 @@ def _get_tools(mcp_instance):
 
 def test_connection():
     """Test connection to AbraFlexi server."""
-    print("=" * 60)
-    print("AbraFlexi MCP Server - Connection Test")
-    print("=" * 60)
-    print()
+    from python_abraflexi import ReadOnly
+    
+    sys.stdout.write("=" * 60 + "\nAbraFlexi MCP Server - Connection Test\n" + "=" * 60 + "\n\n")
     
     # Get configuration
     url = os.getenv("ABRAFLEXI_URL")
@@ -48,85 +85,65 @@ def test_connection():
     password = os.getenv("ABRAFLEXI_PASSWORD")
     
     if not url or not company:
-        print("❌ Error: ABRAFLEXI_URL and ABRAFLEXI_COMPANY must be set")
+        print(f"{_FAIL} Error: ABRAFLEXI_URL and ABRAFLEXI_COMPANY must be set")
         return False
     
     if not (user and password):
-        print("❌ Error: ABRAFLEXI_LOGIN and ABRAFLEXI_PASSWORD must be set")
+        print(f"{_FAIL} Error: ABRAFLEXI_LOGIN and ABRAFLEXI_PASSWORD must be set")
         return False
     
-    print(f"Testing connection to: {url}")
-    print(f"Company: {company}")
-    print(f"User: {user}")
-    print()
+    sys.stdout.write(f"Testing connection to: {url}\nCompany: {company}\nUser: {user}\n\n")
+    
+    base = {'url': url, 'company': company, 'user': user, 'password': password}
     
     try:
         # Test connection with company info (evidence=None)
         print("1. Testing basic connection (company info)...")
-        client = ReadOnly(None, {
-            'url': url,
-            'company': company,
-            'user': user,
-            'password': password,
-            'evidence': None
-        })
+        client = ReadOnly(None, {**base, 'evidence': None})
         
         result = client.perform_request()
         if result:
-            print("   ✓ Connection successful!")
+            print(f"   {_OK} Connection successful!")
         else:
-            print("   ❌ Connection failed - no data returned")
+            print(f"   {_FAIL} Connection failed - no data returned")
             return False
         
         # Test invoice evidence
         print("\n2. Testing invoice evidence (faktura-vydana)...")
-        invoice_client = ReadOnly(None, {
-            'url': url,
-            'company': company,
-            'user': user,
-            'password': password,
-            'evidence': 'faktura-vydana'
-        })
-        invoice_client.default_url_params['limit'] = 5
+        invoice_client = ReadOnly(None, {**base, 'evidence': 'faktura-vydana'})
+        # Only record IDs are needed to count the results
+        invoice_client.default_url_params.update({'limit': 5, 'detail': 'id'})
         invoices = invoice_client.get_all_from_abraflexi()
         
         if invoices:
-            print(f"   ✓ Retrieved {len(invoices)} invoices")
+            print(f"   {_OK} Retrieved {len(invoices)} invoices")
         else:
-            print("   ✓ No invoices found (or empty result)")
+            print(f"   {_OK} No invoices found (or empty result)")
         
         # Test contact evidence
         print("\n3. Testing contact evidence (adresar)...")
-        contact_client = ReadOnly(None, {
-            'url': url,
-            'company': company,
-            'user': user,
-            'password': password,
-            'evidence': 'adresar'
-        })
-        contact_client.default_url_params['limit'] = 5
+        contact_client = ReadOnly(None, {**base, 'evidence': 'adresar'})
+        contact_client.default_url_params.update({'limit': 5, 'detail': 'id'})
         contacts = contact_client.get_all_from_abraflexi()
         
         if contacts:
-            print(f"   ✓ Retrieved {len(contacts)} contacts")
+            print(f"   {_OK} Retrieved {len(contacts)} contacts")
         else:
-            print("   ✓ No contacts found (or empty result)")
+            print(f"   {_OK} No contacts found (or empty result)")
         
         # Test read-only mode
         print("\n4. Testing read-only mode...")
-        read_only = os.getenv('READ_ONLY', 'true').lower() in ('true', '1', 'yes')
+        read_only = _envbool('READ_ONLY', 'true')
         if read_only:
-            print("   ✓ Read-only mode is ENABLED (write operations blocked)")
+            print(f"   {_OK} Read-only mode is ENABLED (write operations blocked)")
         else:
-            print("   ⚠ Read-only mode is DISABLED (write operations allowed)")
+            print(f"   {_WARN} Read-only mode is DISABLED (write operations allowed)")
         
-        print("\n" + "=" * 60)
-        print("✅ All tests passed!")
-        print("=" * 60)
+        sys.stdout.write("\n" + "=" * 60 + f"\n{_DONE} All tests passed!\n" + "=" * 60 + "\n")
         return True
         
     except Exception as e:
-        print(f"\n❌ Test failed: {e}")
+        print(f"\n{_FAIL} Test failed: {e}")
         import traceback
         traceback.print_exc()
         return False
@@ -134,38 +151,35 @@ def test_connection():
 
 def test_write_operations():
     """Test write operations (only if read-only mode is disabled)."""
-    read_only = os.getenv('READ_ONLY', 'true').lower() in ('true', '1', 'yes')
+    read_only = _envbool('READ_ONLY', 'true')
     
     if read_only:
-        print("\nℹ️  Skipping write operation tests (read-only mode enabled)")
+        print(f"\n{_INFO}  Skipping write operation tests (read-only mode enabled)")
         return True
     
-    print("\n" + "=" * 60)
-    print("Testing Write Operations")
-    print("=" * 60)
+    from python_abraflexi import ReadWrite
+    
+    sys.stdout.write("\n" + "=" * 60 + "\nTesting Write Operations\n" + "=" * 60 + "\n")
     
     url = os.getenv("ABRAFLEXI_URL")
     company = os.getenv("ABRAFLEXI_COMPANY")
     user = os.getenv("ABRAFLEXI_LOGIN")
     password = os.getenv("ABRAFLEXI_PASSWORD")
+    base = {'url': url, 'company': company, 'user': user, 'password': password}
     
     try:
-        print("\n⚠️  Warning: This will create test data in your AbraFlexi instance")
-        print("Press Ctrl+C to cancel, or Enter to continue...")
+        sys.stdout.write(
+            f"\n{_WARN}  Warning: This will create test data in your AbraFlexi instance\n"
+            "Press Ctrl+C to cancel, or Enter to continue...\n"
+        )
         input()
         
         # Test creating a contact
         print("\n1. Creating test contact...")
-        client = ReadWrite(None, {
-            'url': url,
-            'company': company,
-            'user': user,
-            'password': password,
-            'evidence': 'adresar'
-        })
+        client = ReadWrite(None, {**base, 'evidence': 'adresar'})
         
-        import time
-        test_kod = f"TEST_{int(time.time())}"
+        # AbraFlexi codes are limited to 20 characters
+        test_kod = f"TEST_{time.time_ns() % 10**15}"
         
         client.set_data_value('kod', test_kod)
         client.set_data_value('nazev', 'Test Contact - MCP Server')
@@ -173,27 +187,27 @@ def test_write_operations():
         result = client.insert_to_abraflexi()
         
         if result:
-            print(f"   ✓ Contact created with ID: {client.last_inserted_id}")
+            print(f"   {_OK} Contact created with ID: {client.last_inserted_id}")
             
             # Try to delete it
             print("\n2. Deleting test contact...")
             delete_result = client.delete()
             if delete_result:
-                print("   ✓ Contact deleted successfully")
+                print(f"   {_OK} Contact deleted successfully")
             else:
-                print("   ❌ Failed to delete contact")
+                print(f"   {_FAIL} Failed to delete contact")
         else:
-            print("   ❌ Failed to create contact")
+            print(f"   {_FAIL} Failed to create contact")
             return False
         
-        print("\n✅ Write operation tests passed!")
+        print(f"\n{_DONE} Write operation tests passed!")
         return True
         
     except KeyboardInterrupt:
         print("\n\nTest cancelled by user")
         return True
     except Exception as e:
-        print(f"\n❌ Write test failed: {e}")
+        print(f"\n{_FAIL} Write test failed: {e}")
         import traceback
         traceback.print_exc()
         return False
@@ -245,73 +259,196 @@ def test_version_consistency():
     unique = set(versions.values())
     print()
     if len(unique) == 1:
-        print(f"   \u2713 All {len(versions)} files report version {unique.pop()}")
+        print(f"   {_OK} All {len(versions)} files report version {unique.pop()}")
         return True
     else:
-        print(f"   \u274c Version mismatch detected:")
+        print(f"   {_FAIL} Version mismatch detected:")
         for fname, ver in versions.items():
             print(f"      {fname}: {ver}")
         return False
 
 
 def test_helpers():
-    """Test helper functions (format_response, is_read_only, evidence_list)."""
+    """Test helper functions (format_response, build_filter, is_read_only, evidence_list)."""
     print("=" * 60)
     print("AbraFlexi MCP Server - Helper Function Tests")
     print("=" * 60)
     print()
 
-    from abraflexi_mcp_server.server import format_response, is_read_only, mcp
+    from abraflexi_mcp_server import server
+    from abraflexi_mcp_server.server import (
+        build_filter, format_created, format_response, is_read_only, mcp
+    )
 
     # format_response: bool
     result = format_response(True)
     parsed = json.loads(result)
     assert parsed == {"success": True}, f"Expected {{success: true}}, got {parsed}"
-    print("   \u2713 format_response(True) -> {\"success\": true}")
+    print(f"   {_OK} format_response(True) -> {{\"success\": true}}")
 
     result = format_response(False)
     parsed = json.loads(result)
     assert parsed == {"success": False}, f"Expected {{success: false}}, got {parsed}"
-    print("   \u2713 format_response(False) -> {\"success\": false}")
+    print(f"   {_OK} format_response(False) -> {{\"success\": false}}")
 
     # format_response: dict
     result = format_response({"id": 1, "kod": "TEST"})
     parsed = json.loads(result)
     assert parsed["id"] == 1 and parsed["kod"] == "TEST"
-    print("   \u2713 format_response(dict) serialises correctly")
+    print(f"   {_OK} format_response(dict) serialises correctly")
 
     # format_response: list
     result = format_response([{"a": 1}, {"b": 2}])
     parsed = json.loads(result)
     assert len(parsed) == 2
-    print("   \u2713 format_response(list) serialises correctly")
+    print(f"   {_OK} format_response(list) serialises correctly")
+
+    # format_response: datetimes look the same with and without orjson
+    from datetime import datetime, timezone
+    parsed = json.loads(format_response({"d": datetime(2024, 1, 2, 10, tzinfo=timezone.utc)}))
+    assert parsed == {"d": "2024-01-02 10:00:00+00:00"}, parsed
+    print(f"   {_OK} format_response(datetime) matches the stdlib encoder")
+
+    # format_created
+    parsed = json.loads(format_created([{"id": "5"}], 5, 'K"1'))
+    assert parsed == {"success": True, "id": 5, "kod": 'K"1'}, parsed
+    parsed = json.loads(format_created(False, None))
+    assert parsed == {"success": False, "id": None}, parsed
+    print(f"   {_OK} format_created() builds valid JSON")
+
+    # build_filter
+    assert build_filter() is None
+    assert build_filter(["1", " 2"]) == "id in (1,2)"
+    assert build_filter(["7"]) == "id=7"
+    assert build_filter(kod="ABC") == "kod='ABC'"
+    assert build_filter(["1"], "ABC", "foo") == "id=1 AND kod='ABC' AND nazev like '*foo*'"
+    print(f"   {_OK} build_filter() combines ids, kod and nazev")
+
+    try:
+        build_filter(["1", "1) OR (1=1"])
+    except ValueError:
+        print(f"   {_OK} build_filter() rejects non-numeric ids")
+    else:
+        raise AssertionError("build_filter() accepted a non-numeric id")
+
+    # evidence_get_stream rejects page sizes and limits that never finish paging
+    stream_fn = _get_tools(mcp)["evidence_get_stream"].fn
+    for kwargs in ({"page_size": 0}, {"page_size": -5}, {"limit": 0}):
+        try:
+            asyncio.run(stream_fn(evidence="adresar", **kwargs))
+        except ValueError as e:
+            assert "at least 1" in str(e), e
+        else:
+            raise AssertionError(f"evidence_get_stream() accepted {kwargs}")
+    print(f"   {_OK} evidence_get_stream() rejects page_size/limit below 1")
+
+    # evidence_bulk_get validates every ID before sending any request
+    bulk_fn = _get_tools(mcp)["evidence_bulk_get"].fn
+    try:
+        asyncio.run(bulk_fn(evidence="adresar", ids=["1"] * 60 + ["x"]))
+    except ValueError as e:
+        assert "Invalid record ID" in str(e), e
+    else:
+        raise AssertionError("evidence_bulk_get() accepted a non-numeric id")
+    print(f"   {_OK} evidence_bulk_get() rejects non-numeric ids up front")
+
+    # response cache
+    server.cache_put(("cenik", None, None, "summary"), "[]")
+    server.cache_put(("adresar", None, None, "summary"), "[]")
+    assert server.cache_get(("cenik", None, None, "summary")) == ("[]" if server.CACHE_TTL > 0 else None)
+    server.cache_invalidate("cenik")
+    assert server.cache_get(("cenik", None, None, "summary")) is None
+    server.cache_invalidate()
+    assert server.cache_get(("adresar", None, None, "summary")) is None
+    # a read that raced with a write must not cache its pre-write result
+    generation = server.cache_generation("adresar")
+    server.cache_invalidate("adresar")
+    server.cache_put(("adresar", None, None, "summary"), "[]", generation)
+    assert server.cache_get(("adresar", None, None, "summary")) is None
+    generation = server.cache_generation("adresar")
+    server.cache_invalidate()
+    server.cache_put(("adresar", None, None, "summary"), "[]", generation)
+    assert server.cache_get(("adresar", None, None, "summary")) is None
+    print(f"   {_OK} response cache stores and invalidates per evidence")
+    print(f"   {_OK} response cache skips results fetched before an invalidation")
+
+    # write error paths and client reset, with stubbed client methods (offline)
+    from python_abraflexi import AbraFlexiException, NotFoundException, ReadWrite
+    client = ReadWrite(None, {
+        "url": "https://abraflexi.example", "company": "demo",
+        "user": "user", "password": "secret", "evidence": "adresar",
+    })
+
+    def raise_not_found(*args):
+        raise NotFoundException("Resource not found")
+
+    def answer_404(*args):
+        client.last_response_code = 404
+        return False
 
-    # is_read_only
+    def raise_import_error(*args):
+        raise AbraFlexiException("HTTP 400: import failed")
+
+    client.throw_exception = False
+    cases = [(raise_not_found, "NotFoundException"), (answer_404, "HTTP 404")]
+    client.perform_request = raise_not_found  # existence check after a failed write
+    cases.append((raise_import_error, "failed write of a missing record"))
+    for operation, label in cases:
+        client.last_response_code = None
+        try:
+            asyncio.run(server._write_record(client, "code:X", "Contact not found", operation))
+        except ValueError as e:
+            assert str(e) == "Contact not found: code:X", e
+        else:
+            raise AssertionError(f"_write_record() ignored {label}")
+    print(f"   {_OK} _write_record() reports missing records as ValueError")
+
+    client.filter = "id=1"
+    client.default_url_params.update({"detail": "full", "limit": 5})
+    client.my_key = 5
+    client.post_fields = '{"winstrom": {}}'
+    client.data = {"kod": "X"}
+    client.last_result = [{"id": "5"}]
+    server._reset_client(client)
+    assert client.filter is None and not client.default_url_params
+    assert client.my_key is None and client.post_fields is None and client.data == {}
+    assert client.last_result is None and not client.api_url.split("?")[0].endswith("/5.json")
+    print(f"   {_OK} _reset_client() clears filter, params, key and payload")
+
+    # READ_ONLY parsing (evaluated once at import)
     original = os.environ.get("READ_ONLY")
     try:
         os.environ["READ_ONLY"] = "true"
-        assert is_read_only() is True
-        print("   \u2713 is_read_only() returns True when READ_ONLY=true")
+        assert server._envbool("READ_ONLY", "true") is True
+        print(f"   {_OK} READ_ONLY=true enables read-only mode")
 
         os.environ["READ_ONLY"] = "false"
-        assert is_read_only() is False
-        print("   \u2713 is_read_only() returns False when READ_ONLY=false")
+        assert server._envbool("READ_ONLY", "true") is False
+        print(f"   {_OK} READ_ONLY=false disables read-only mode")
+
+        os.environ.pop("READ_ONLY")
+        assert server._envbool("READ_ONLY", "true") is True
+        print(f"   {_OK} read-only mode is enabled by default")
     finally:
         if original is not None:
             os.environ["READ_ONLY"] = original
         else:
             os.environ.pop("READ_ONLY", None)
 
+    # is_read_only reports the mode frozen at import
+    assert is_read_only() is server._READ_ONLY
+    print(f"   {_OK} is_read_only() returns {server._READ_ONLY}")
+
     # evidence_list returns valid JSON with expected keys
     tools = _get_tools(mcp)
     evidence_list_fn = tools["evidence_list"].fn
     el_result = json.loads(evidence_list_fn())
     assert isinstance(el_result, list) and len(el_result) > 0
     assert all("name" in e and "description" in e for e in el_result)
-    print(f"   \u2713 evidence_list() returns {len(el_result)} evidences with name+description")
+    print(f"   {_OK} evidence_list() returns {len(el_result)} evidences with name+description")
 
     print()
-    print("\u2705 All helper function tests passed!")
+    print(f"{_DONE} All helper function tests passed!")
     return True
 
 
@@ -343,25 +480,25 @@ def test_packaging_artifacts():
     for rel in required_files:
         path = PROJECT_ROOT / rel
         if path.exists():
-            print(f"   \u2713 {rel}")
+            print(f"   {_OK} {rel}")
         else:
-            print(f"   \u274c {rel} NOT FOUND")
+            print(f"   {_FAIL} {rel} NOT FOUND")
             ok = False
 
     # Validate server.json schema basics
     server_json = json.loads((PROJECT_ROOT / "server.json").read_text())
     for key in ("name", "version", "repository", "packages"):
         if key not in server_json:
-            print(f"   \u274c server.json missing '{key}'")
+            print(f"   {_FAIL} server.json missing '{key}'")
             ok = False
         else:
-            print(f"   \u2713 server.json has '{key}'")
+            print(f"   {_OK} server.json has '{key}'")
 
     print()
     if ok:
-        print("\u2705 All packaging artifact tests passed!")
+        print(f"{_DONE} All packaging artifact tests passed!")
     else:
-        print("\u274c Some packaging artifact tests failed!")
+        print(f"{_FAIL} Some packaging artifact tests failed!")
     return ok
 
 
@@ -376,45 +513,29 @@ def test_mcp_tools():
         from abraflexi_mcp_server.server import mcp
 
         tools = _get_tools(mcp)
-        print(f"   \u2713 Server module imported successfully")
-        print(f"   \u2713 {len(tools)} tools registered")
+        print(f"   {_OK} Server module imported successfully")
+        print(f"   {_OK} {len(tools)} tools registered")
         print()
 
-        expected_tools = [
-            "invoice_issued_get", "invoice_issued_create",
-            "invoice_issued_update", "invoice_issued_delete",
-            "invoice_received_get", "invoice_received_create",
-            "contact_get", "contact_create",
-            "contact_update", "contact_delete",
-            "product_get", "product_create",
-            "product_update", "product_delete",
-            "bank_transaction_get", "bank_transaction_create",
-            "evidence_get", "evidence_create",
-            "evidence_update", "evidence_delete",
-            "evidence_list",
-        ]
-
-        missing = [t for t in expected_tools if t not in tools]
+        missing = EXPECTED_TOOLS - tools.keys()
         if missing:
-            print(f"   \u274c Missing tools: {', '.join(missing)}")
+            print(f"   {_FAIL} Missing tools: {', '.join(sorted(missing))}")
             return False
-        print(f"   \u2713 All {len(expected_tools)} expected tools present")
+        print(f"   {_OK} All {len(EXPECTED_TOOLS)} expected tools present")
 
-        extra = [t for t in tools if t not in expected_tools]
+        extra = tools.keys() - EXPECTED_TOOLS
         if extra:
-            print(f"   \u26a0 Unexpected tools (not in expected list): {', '.join(extra)}")
+            print(f"   {_WARN} Unexpected tools (not in expected list): {', '.join(sorted(extra))}")
 
         # Verify no **kwargs in any tool function (FastMCP forbids it)
         print()
         print("Checking tool signatures (no **kwargs allowed)...")
+        CO_VARKEYWORDS = 0x08  # inspect.CO_VARKEYWORDS
         for name, tool in tools.items():
-            fn = tool.fn
-            sig = inspect.signature(fn)
-            for param in sig.parameters.values():
-                if param.kind == inspect.Parameter.VAR_KEYWORD:
-                    print(f"   \u274c {name} still has **kwargs")
-                    return False
-            print(f"   \u2713 {name}")
+            if tool.fn.__code__.co_flags & CO_VARKEYWORDS:
+                print(f"   {_FAIL} {name} still has **kwargs")
+                return False
+            print(f"   {_OK} {name}")
 
         # Verify create/update tools accept extra_fields or data dict
         print()
@@ -432,20 +553,19 @@ def test_mcp_tools():
             "product_update": "data",
             "evidence_update": "data",
         }
-        for name, param_name in {**create_tools, **update_tools}.items():
-            fn = tools[name].fn
-            sig = inspect.signature(fn)
-            if param_name not in sig.parameters:
-                print(f"   \u274c {name} missing '{param_name}' parameter")
+        for name, param_name in itertools.chain(create_tools.items(), update_tools.items()):
+            code = tools[name].fn.__code__
+            if param_name not in code.co_varnames[:code.co_argcount + code.co_kwonlyargcount]:
+                print(f"   {_FAIL} {name} missing '{param_name}' parameter")
                 return False
-            print(f"   \u2713 {name} has '{param_name}'")
+            print(f"   {_OK} {name} has '{param_name}'")
 
         print()
-        print("\u2705 All tool registration tests passed!")
+        print(f"{_DONE} All tool registration tests passed!")
         return True
 
     except Exception as e:
-        print(f"\n\u274c Tool test failed: {e}")
+        print(f"\n{_FAIL} Tool test failed: {e}")
         import traceback
         traceback.print_exc()
         return False
@@ -469,11 +589,11 @@ if __name__ == "__main__":
 
     if all(results):
         print("\n" + "=" * 60)
-        print("\u2705 ALL TESTS PASSED")
+        print(f"{_DONE} ALL TESTS PASSED")
         print("=" * 60)
     else:
         print("\n" + "=" * 60)
-        print("\u274c SOME TESTS FAILED")
+        print(f"{_FAIL} SOME TESTS FAILED")
         print("=" * 60)
 
     sys.exit(0 if all(results) else 1)
@@ -1,21 +1,34 @@
-from setuptools import setup, find_packages
+from setuptools import setup
+
+
+def _read_readme():
+    """Return the README used as the long description."""
+    try:
+        with open("README.md", encoding="utf-8") as f:
+            return f.read()
+    except OSError:
+        return ""
+
 
 setup(
     name="abraflexi-mcp-server",
     version="1.0.1",
     description="A comprehensive MCP server for AbraFlexi integration",
-    long_description=open("README.md").read(),
+    long_description=_read_readme(),
     long_description_content_type="text/markdown",
     author="Vítězslav Dvořák",
     author_email="info@vitexsoftware.cz",
     url="https://github.com/VitexSoftware/abraflexi-mcp-server",
-    packages=find_packages(),
+    packages=["abraflexi_mcp_server"],
     include_package_data=True,
     install_requires=[
         "fastmcp>=2.12.4",
-        "python-abraflexi>=1.0.0",
+        "python-abraflexi>=1.1.2",
         "python-dotenv>=1.1.1",
     ],
+    extras_require={
+        "speedups": ["orjson>=3.9", "uvloop>=0.17; sys_platform != 'win32'"],
+    },
     entry_points={
         "console_scripts": [
             "abraflexi-mcp=abraflexi_mcp_server.server:main",